@@ -1,19 +1,15 @@
-import base64
-import hashlib
+import functools
 import json
+import os
 import platform
 import shutil
-import subprocess
 import sys
-import tempfile
 from pathlib import Path
 from typing import List, Optional, Tuple, Any, Dict
 
 import click
-import colorama
 import structlog
 from click.decorators import pass_meta_key
-from podman import PodmanClient
 
 from podkernel.kernelspec import user_kernelspec_store, make_kernel_id, install_kernelspec, validate_kernel_id, \
     KERNELSPEC_FILENAME
@@ -34,6 +30,29 @@ CONTAINER_CONNECTION_SPEC_ENV_VARS = (f"{ENV_PREFIX}_CONNECTION_FILE", "DOCKERNE
 
 JUPYTER_CONNECTION_FILE_TEMPLATE = "{connection_file}"
 
+# Port keys defined by the Jupyter connection file spec.
+_CONNECTION_PORT_KEYS = ("shell_port", "iopub_port", "stdin_port", "control_port", "hb_port")
+
+# Run arguments we manage ourselves, so users may not supply them.
+_DISALLOWED_RUN_ARGS = frozenset(
+    {
+        "--rm",
+        "-d",
+        "--detach",
+        "-i",
+        "--interactive",
+        "-t",
+        "--tty",
+        "-a",
+        "--attach",
+    }
+)
+_DISALLOWED_RUN_ARG_PREFIXES = ("--rm=",)
+
+# Expanded once - symlinked home directories are rare and the lexical path is
+# what we want to store in the kernelspec anyway.
+_HOME = Path("~").expanduser()
+
 META_SYSTEM_TYPE = "system_type"
 pass_system_type = pass_meta_key(META_SYSTEM_TYPE, doc_description="Current Python system type")
 
@@ -56,6 +75,11 @@ pass_container_command = pass_meta_key(
 @click.pass_context
 def cli(ctx: click.Context, log_level: str, log_format: str, log_dest: str, system_type: str, container_command: str):
     """Manage Jupyter kernels in Podman containers"""
+    if ctx.resilient_parsing or ctx.invoked_subcommand is None:
+        # Click is only going to print help or complete arguments - don't pay
+        # for logging setup.
+        return
+
     configure_logging(log_level, log_format, log_dest)
     logger.debug("Logging Configured", log_level=log_level, log_format=log_format, log_dest=log_dest)
 
@@ -64,25 +88,105 @@ def cli(ctx: click.Context, log_level: str, log_format: str, log_dest: str, syst
     ctx.meta[META_KERNEL_SPEC_DIR] = user_kernelspec_store(system_type)
     ctx.meta[META_CONTAINER_CMD] = container_command
 
+def _user_cache_dir() -> Path:
+    """Return the per-user cache directory for podkernel"""
+    return Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / NAMESPACE
+
+class _KernelIndex:
+    """Persistent cache of parsed kernel.json files
+
+    Entries are keyed by kernelspec file path and validated against
+    ``(st_mtime_ns, st_size)``, so listing kernels on a warm cache is a stat
+    walk rather than a parse of every kernel.json.
+    """
+
+    INDEX_FILENAME = "index.json"
+
+    def __init__(self, index_file: Optional[Path] = None):
+        self._index_file = index_file if index_file is not None else _user_cache_dir() / self.INDEX_FILENAME
+        self._dirty = False
+        try:
+            self._entries = json.loads(self._index_file.read_text())
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def lookup(self, kernel_specfile: Path) -> Optional[Dict[str, Any]]:
+        """Return the parsed kernelspec, or None if the file does not exist"""
+        try:
+            st = kernel_specfile.stat()
+        except OSError:
+            return None
+        key = kernel_specfile.as_posix()
+        entry = self._entries.get(key)
+        if entry is not None and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return entry["kernelspec"]
+        kernelspec = json.loads(kernel_specfile.read_text())
+        self._entries[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "kernelspec": kernelspec}
+        self._dirty = True
+        return kernelspec
+
+    def save(self) -> None:
+        """Persist the index atomically if any entries changed"""
+        if not self._dirty:
+            return
+        try:
+            self._index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmpfile = self._index_file.with_name(f".{self.INDEX_FILENAME}.tmp")
+            tmpfile.write_text(json.dumps(self._entries))
+            os.replace(tmpfile, self._index_file)
+        except OSError:
+            logger.debug("Could not persist kernel index", index_file=self._index_file.as_posix())
+
+# Sidecar file written next to kernel.json so `list` can show the display name
+# without parsing the full kernelspec.
+DISPLAY_NAME_FILENAME = ".display_name"
+
+def _common_list_names(kernel_spec_dir: Path) -> Dict[str, str]:
+    """Map installed podkernel IDs to display names
+
+    Prefers the display name sidecar and only falls back to parsing
+    kernel.json for specs installed before the sidecar existed.
+    """
+    display_names = {}
+    index = _KernelIndex()
+    with os.scandir(kernel_spec_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                display_names[entry.name] = (Path(entry.path) / DISPLAY_NAME_FILENAME).read_text()
+                continue
+            except OSError:
+                pass
+            kernelspec = index.lookup(Path(entry.path) / KERNELSPEC_FILENAME)
+            if kernelspec is None:
+                continue
+            if NAMESPACE in kernelspec.get("metadata", {}):
+                display_names[entry.name] = kernelspec["display_name"]
+    index.save()
+    return display_names
+
 def _common_list(kernel_spec_dir: Path) -> Dict[str,Any]:
     podkernels = {}
-    for item in kernel_spec_dir.iterdir():
-        if not item.is_dir():
-            continue
-        kernel_specfile = (item / KERNELSPEC_FILENAME)
-        if not kernel_specfile.exists():
-            continue
-        kernelspec = json.loads(kernel_specfile.read_text())
-        if NAMESPACE in kernelspec.get("metadata", {}):
-            podkernels[item.name] = kernelspec
+    index = _KernelIndex()
+    with os.scandir(kernel_spec_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            kernelspec = index.lookup(Path(entry.path) / KERNELSPEC_FILENAME)
+            if kernelspec is None:
+                continue
+            if NAMESPACE in kernelspec.get("metadata", {}):
+                podkernels[entry.name] = kernelspec
+    index.save()
     return podkernels
 
 @cli.command("list")
 @pass_kernel_spec_dir
 def cli_list(kernel_spec_dir: Path):
     """List installed podkernels"""
-    for kernel_id, kernelspec in _common_list(kernel_spec_dir).items():
-        click.echo(f"{kernel_id}\t{kernelspec['display_name']}")
+    for kernel_id, display_name in _common_list_names(kernel_spec_dir).items():
+        click.echo(f"{kernel_id}\t{display_name}")
 
 @cli.command("delete")
 @click.option("--doit/--dryrun", default=False, type=click.BOOL, help="Actually delete the kernel")
@@ -131,14 +235,21 @@ def cli_install(kernel_spec_dir: Path, display_name: str,
 
       [podman build args] -- [podman run args] -- [container command args]
     """
+    import base64
+    import hashlib
+
     log = logger
 
     if build:
         # Check if the path is under $HOME and store it relatively if so. Otherwise, absolute.
-        build_path = Path(image_name).absolute().resolve()
-        home_dir = Path("~").expanduser().resolve()
+        build_path = Path(image_name)
+        if not build_path.is_absolute():
+            build_path = Path.cwd() / build_path
+        # Only pay for a full symlink walk when the path actually is one.
+        if build_path.is_symlink():
+            build_path = build_path.resolve()
         try:
-            build_path = build_path.relative_to(home_dir)
+            build_path = build_path.relative_to(_HOME)
             build_path = Path("~") / build_path
             log.debug("Directory path is not in user home directory - storing as relative path")
         except ValueError:
@@ -189,28 +300,12 @@ def cli_install(kernel_spec_dir: Path, display_name: str,
         arg_list_has_errors = True
 
     log.debug("Validating run_args")
-    disallowed_run_args = {
-        "--rm",
-        "-d",
-        "--detach",
-        "-i",
-        "--interactive",
-        "-t",
-        "--tty",
-        "-a",
-        "--attach",
-    }
     for value in run_args:
-        if value.startswith("--rm"):
+        if value in _DISALLOWED_RUN_ARGS or value.startswith(_DISALLOWED_RUN_ARG_PREFIXES):
             logger.error(f"run_args cannot contain {value} as it will be overridden on execution")
             arg_list_has_errors = True
             continue
 
-        if value in disallowed_run_args:
-            logger.error(f"run_args cannot contain {value} as it will be overriden on execution")
-            arg_list_has_errors = True
-            continue
-
     if arg_list_has_errors:
         raise click.ClickException("Supplied argument lists have options which are not allowed - check error messages.")
 
@@ -223,9 +318,14 @@ def cli_install(kernel_spec_dir: Path, display_name: str,
         cmd_args=cmd_args,
     )
 
+    # Dump once - the same dict feeds both the ID hash and the kernelspec metadata.
+    kernel_meta_dump = kernel_meta.model_dump()
+
     log.debug("Generate unique kernel ID based on metadata")
-    hashtag = base64.urlsafe_b64encode(hashlib.sha256(kernel_meta.model_dump_json(indent=False).encode("utf8")).digest()).decode()
-    kernel_id = make_kernel_id(f"{image_name.lstrip('~/')}-{hashtag.rstrip('=')}")
+    hash_payload = json.dumps(kernel_meta_dump, sort_keys=True, separators=(",", ":")).encode("utf8")
+    digest = hashlib.blake2b(hash_payload, digest_size=16).digest()
+    hashtag = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+    kernel_id = make_kernel_id(f"{image_name.lstrip('~/')}-{hashtag}")
     validate_kernel_id(kernel_id)
     log = log.bind(kernel_id=kernel_id)
 
@@ -236,7 +336,7 @@ def cli_install(kernel_spec_dir: Path, display_name: str,
         language=language,
         interrupt_mode=JupyterInterruptMode.Message,
         metadata={
-            NAMESPACE: kernel_meta.model_dump(),
+            NAMESPACE: kernel_meta_dump,
         },
     )
 
@@ -252,9 +352,24 @@ def cli_install(kernel_spec_dir: Path, display_name: str,
 
     log.info("Installing new kernel")
     kernel_dir.mkdir(parents=True, exist_ok=True)
-    kernel_specfile.write_text(kernelspec.model_dump_json(indent=True, exclude_unset=True))
+    try:
+        # Optional extra - dumping the plain dict through orjson is a single C
+        # call versus pydantic's serializer.
+        import orjson
+
+        kernel_specfile.write_bytes(
+            orjson.dumps(kernelspec.model_dump(mode="json", exclude_unset=True), option=orjson.OPT_INDENT_2)
+        )
+    except ImportError:
+        kernel_specfile.write_text(kernelspec.model_dump_json(indent=2, exclude_unset=True))
+    (kernel_dir / DISPLAY_NAME_FILENAME).write_text(display_name)
     log.info("New kernel installed")
 
+@functools.lru_cache(maxsize=8)
+def _which_cached(cmd: str) -> Optional[str]:
+    """shutil.which with the PATH walk cached for the process lifetime"""
+    return shutil.which(cmd)
+
 def _common_startup(container_cmd: str, kernel_spec_dir: Path, kernel_id: str) -> Tuple[structlog.BoundLogger, str, JupyterKernelSpec, PodKernelMetadata]:
     """Common startup for commands handling kernel specs
 
@@ -263,7 +378,7 @@ def _common_startup(container_cmd: str, kernel_spec_dir: Path, kernel_id: str) -
     log = logger.bind(kernel_id=kernel_id)
 
     log.debug("Discovering container command", container_cmd=container_cmd)
-    container_exe = shutil.which(container_cmd)
+    container_exe = _which_cached(container_cmd)
     log = log.bind(container_exe=container_exe)
 
     kernel_dir = kernel_spec_dir / kernel_id
@@ -281,39 +396,54 @@ def _common_startup(container_cmd: str, kernel_spec_dir: Path, kernel_id: str) -
 
 def _inspect_image(container_exe: str, kernel_meta: PodKernelMetadata) -> Optional[str]:
     """Inspect an image using the command line"""
-    try:
-        inspect_result = subprocess.check_output([container_exe, "inspect", kernel_meta.image_name], encoding="utf8")
-    except subprocess.CalledProcessError as e:
-        inspect_result = e.output
-    inspect_obj = json.loads(inspect_result)
-    if len(inspect_obj) == 0:
+    import subprocess
+
+    # Ask podman for the ID directly - no JSON to parse, and a missing image
+    # is just a non-zero exit. Capture raw bytes and decode only the ID line.
+    inspect_result = subprocess.run(
+        [container_exe, "inspect", "--format", "{{.Id}}", kernel_meta.image_name], capture_output=True
+    )
+    if inspect_result.returncode != 0:
         return None
-    return inspect_obj[0]["Id"]
+    return inspect_result.stdout.strip().decode("utf8") or None
 
 def _common_build(log: structlog.BoundLogger, kernel_id: str, container_exe: str, kernel_meta: PodKernelMetadata, pull=False) -> Optional[str]:
     """Build a configured kernel"""
+    import subprocess
+    import tempfile
+
     image_id = None
 
     if kernel_meta.build:
         log.info("Building image")
-        with tempfile.NamedTemporaryFile(prefix=f"{NAMESPACE}.{kernel_id}.", suffix=".iid", mode="rt",
-                                         delete=True) as iidfile:
-            build_cmd = [container_exe, "build"] + kernel_meta.build_args + ["--iidfile", iidfile.name] + [
+        # mkstemp is enough here - we only need a path to hand to --iidfile,
+        # not an open file object with a finalizer.
+        iid_fd, iidfile_name = tempfile.mkstemp(prefix=f"{NAMESPACE}.{kernel_id}.", suffix=".iid")
+        os.close(iid_fd)
+        try:
+            build_cmd = [container_exe, "build"] + kernel_meta.build_args + ["--iidfile", iidfile_name] + [
                 Path(kernel_meta.image_name).expanduser().as_posix()]
             log.debug("Executing command", build_cmd=build_cmd)
             subprocess.check_call(build_cmd)
-            image_id = iidfile.readline()
-            log.debug("Read image ID from file", image_id=image_id, iidfile=iidfile.name)
+            image_id = Path(iidfile_name).read_text().strip()
+            log.debug("Read image ID from file", image_id=image_id, iidfile=iidfile_name)
+        finally:
+            os.unlink(iidfile_name)
     else:
         log.debug("Inspecting container image ID")
         image_id = _inspect_image(container_exe, kernel_meta)
         if image_id is None and pull:
             log.info("Image not found - attempting to pull image")
-            try:
-                subprocess.run([container_exe, "pull", kernel_meta.image_name])
-            except subprocess.CalledProcessError as e:
-                log.error("Error pulling container image", retcode=e.returncode)
-            image_id = _inspect_image(container_exe, kernel_meta)
+            # podman pull --quiet prints the pulled image ID, so a successful
+            # pull does not need a second inspect round trip.
+            pull_result = subprocess.run(
+                [container_exe, "pull", "--quiet", kernel_meta.image_name], capture_output=True, text=True
+            )
+            if pull_result.returncode != 0:
+                log.error("Error pulling container image", retcode=pull_result.returncode)
+            image_id = pull_result.stdout.strip() or None
+            if image_id is None:
+                image_id = _inspect_image(container_exe, kernel_meta)
             if image_id is None:
                 log.error("Image still not found after attempting pull.")
 
@@ -334,6 +464,8 @@ def cli_build(container_cmd: str, kernel_spec_dir: Path, kernel_id: str):
     For non-build kernels, this will trigger an image pull which can be useful if you
     do not run your images with --pull=always as a run argument.
     """
+    import colorama
+
     log, container_exe, existing_spec, kernel_meta = _common_startup(container_cmd, kernel_spec_dir, kernel_id)
     image_id = _common_build(log, kernel_id, container_exe, kernel_meta)
     if image_id is None:
@@ -347,6 +479,7 @@ def cli_build(container_cmd: str, kernel_spec_dir: Path, kernel_id: str):
 @pass_container_command
 def cli_start(container_cmd: str, kernel_spec_dir: Path, kernel_id: str, connection_file: str):
     """Start a kernel"""
+    import subprocess
 
     log, container_exe, existing_spec, kernel_meta = _common_startup(container_cmd, kernel_spec_dir, kernel_id)
 
@@ -356,13 +489,15 @@ def cli_start(container_cmd: str, kernel_spec_dir: Path, kernel_id: str, connect
 
     log.info("Current directory", curdir=Path(".").resolve())
 
-    log.debug("Reading connection file for container")
-    connection_obj = json.loads(Path(connection_file).read_text())
-    connection_obj["ip"] = "0.0.0.0"
-    connection_ports = {v for k,v in connection_obj.items() if "_port" in k}
-
     log.debug("Updating connection file for container")
-    Path(connection_file).write_text(json.dumps(connection_obj, indent=True))
+    with open(connection_file, "r+", encoding="utf8") as connection_fileobj:
+        connection_obj = json.load(connection_fileobj)
+        connection_obj["ip"] = "0.0.0.0"
+        connection_fileobj.seek(0)
+        connection_fileobj.truncate()
+        json.dump(connection_obj, connection_fileobj, separators=(",", ":"))
+
+    connection_ports = sorted({connection_obj[k] for k in _CONNECTION_PORT_KEYS if k in connection_obj})
 
     # Add the additional arguments
     control_args = [
@@ -375,7 +510,7 @@ def cli_start(container_cmd: str, kernel_spec_dir: Path, kernel_id: str, connect
         control_args.extend(["-e", f"{env_var}={CONTAINER_CONNECTION_SPEC_PATH}",])
 
     # Add the port mappings
-    for port in sorted(connection_ports):
+    for port in connection_ports:
         control_args.extend(["-p", f"127.0.0.1:{port}:{port}"])
 
     run_cmd = [container_exe, "run", ] + kernel_meta.run_args + control_args + [image_id] + kernel_meta.cmd_args
@@ -7,8 +7,10 @@ Where term "kernelspec store" is used, it references the directory where
 jupyter will look for kernelspec dirs.
 """
 
+import itertools
 import os
 from pathlib import Path
+import re
 import string
 
 from podkernel.logging import get_logger
@@ -20,6 +22,9 @@ KERNELSPEC_FILENAME = "kernel.json"
 KERNELSPEC_STORE_DIRNAME = "kernels"
 KERNELSPEC_KERNELID_ALLOWED_CHARACTERS = set(string.ascii_letters + string.digits + "_.-")
 
+# Matches any character not in KERNELSPEC_KERNELID_ALLOWED_CHARACTERS.
+_KERNEL_ID_DISALLOWED_RE = re.compile(r"[^A-Za-z0-9_.\-]")
+
 def make_kernel_id(name: str) -> str:
     """
     Generate a valid kernel ID from a given name. This is not guaranteed to be unique.
@@ -32,11 +37,11 @@ def make_kernel_id(name: str) -> str:
     -------
     valid kernel ID name
     """
-    return "".join(c if c in KERNELSPEC_KERNELID_ALLOWED_CHARACTERS else "_" for c in name)
+    return _KERNEL_ID_DISALLOWED_RE.sub("_", name)
 
 def validate_kernel_id(kernel_id: str):
-    if not set(kernel_id) <= KERNELSPEC_KERNELID_ALLOWED_CHARACTERS:
-        disallowed_chars = set(kernel_id) - KERNELSPEC_KERNELID_ALLOWED_CHARACTERS
+    if _KERNEL_ID_DISALLOWED_RE.search(kernel_id):
+        disallowed_chars = set(_KERNEL_ID_DISALLOWED_RE.findall(kernel_id))
         raise ValueError(f"kernel_id contains forbidden characters: {kernel_id} ({''.join(disallowed_chars)})")
 
 # TODO: make sure windows path is expanded properly
@@ -84,21 +89,19 @@ def install_kernelspec(kernelspec_store: Path, kernelspec: JupyterKernelSpec, ke
 
     """
     validate_kernel_id(kernel_id)
+
+    logger.debug("Checking if kernel already exists", kernel_id=kernel_id)
+    existing = {entry.name for entry in os.scandir(kernelspec_store)}
+
     real_kernel_id = kernel_id
-    idx = 0
-
-    while True:
-        kernel_dir = (kernelspec_store / real_kernel_id)
-        logger.debug("Checking if kernel already exists", kernel_id=real_kernel_id)
-        if kernel_dir.exists():
-            logger.debug("Kernel with same ID already exists - incrementing ID")
-            real_kernel_id = f"{kernel_id}_{idx}"
-            idx += 1
-        else:
-            kernel_dir.mkdir()
-            break
+    if kernel_id in existing:
+        logger.debug("Kernel with same ID already exists - incrementing ID")
+        real_kernel_id = next(f"{kernel_id}_{idx}" for idx in itertools.count() if f"{kernel_id}_{idx}" not in existing)
+
+    kernel_dir = (kernelspec_store / real_kernel_id)
+    kernel_dir.mkdir()
 
     logger.info("Installed new kernel", kernel_id=real_kernel_id)
-    (kernel_dir / KERNELSPEC_FILENAME).write_text(kernelspec.model_dump_json(indent=True))
+    (kernel_dir / KERNELSPEC_FILENAME).write_text(kernelspec.model_dump_json(indent=2))
 
     return real_kernel_id
@@ -1,5 +1,6 @@
 """Internal implementation of logging configuration."""
 
+import functools
 import json
 import logging
 import sys
@@ -11,14 +12,16 @@ DEFAULT_LOG_LEVEL = "info"
 DEFAULT_LOG_FORMAT = "console"
 DEFAULT_LOG_DEST = "stderr"
 
-_LOG_FORMATS = {
-    "console": structlog.dev.ConsoleRenderer(),
-    "kv": structlog.processors.KeyValueRenderer(
+# Renderer factories - only the selected renderer is constructed, and only
+# when logging is actually configured.
+_LOG_FORMAT_FACTORIES = {
+    "console": structlog.dev.ConsoleRenderer,
+    "kv": lambda: structlog.processors.KeyValueRenderer(
         key_order=["event"],
         drop_missing=True,
         sort_keys=True,
     ),
-    "json": structlog.processors.JSONRenderer(serializer=json.dumps),
+    "json": lambda: structlog.processors.JSONRenderer(serializer=json.dumps),
 }
 
 _LOG_TARGETS = {
@@ -38,17 +41,9 @@ _LOG_TARGETS = {
 #     def emit(self, record):
 #         self._log.log(record.levelno, record.msg, name=record.name)
 
-"""Standard logging configuration"""
-_logging_configured = False
-
-
+@functools.cache
 def configure_logging(log_level: str, log_format: str, log_dest: str) -> None:
     """Run once logging configuration."""
-    global _logging_configured
-
-    if _logging_configured is True:
-        return
-
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
@@ -75,7 +70,7 @@ def configure_logging(log_level: str, log_format: str, log_dest: str) -> None:
         structlog.processors.TimeStamper(fmt="iso"),
     ]
 
-    processor = _LOG_FORMATS.get(log_format, "unknown")
+    processor = _LOG_FORMAT_FACTORIES.get(log_format, _LOG_FORMAT_FACTORIES[DEFAULT_LOG_FORMAT])()
 
     formatter = structlog.stdlib.ProcessorFormatter(
         processor=processor,
@@ -91,8 +86,6 @@ def configure_logging(log_level: str, log_format: str, log_dest: str) -> None:
 
     root_logger.debug(f"Logging configured: {log_level} {log_format} {log_dest}")
 
-    _logging_configured = True
-
 
 get_logger: Callable[..., structlog.BoundLogger] = structlog.get_logger
 """
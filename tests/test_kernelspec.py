@@ -1,9 +1,24 @@
 import platform
 
-from podkernel.kernelspec import user_kernelspec_store
+import pytest
+
+from podkernel.kernelspec import make_kernel_id, user_kernelspec_store, validate_kernel_id
 
 
 def test_user_kernelspec_store():
     """Test the user kernelspec store function works"""
     result = user_kernelspec_store(platform.system())
     assert result.is_absolute()
+
+
+def test_make_kernel_id():
+    """Test disallowed characters are replaced with underscores"""
+    assert make_kernel_id("my image:latest/tag") == "my_image_latest_tag"
+    assert make_kernel_id("already-valid_id.1") == "already-valid_id.1"
+
+
+def test_validate_kernel_id():
+    """Test kernel ID validation accepts valid IDs and rejects invalid ones"""
+    validate_kernel_id("valid-kernel_id.1")
+    with pytest.raises(ValueError):
+        validate_kernel_id("invalid kernel id!")